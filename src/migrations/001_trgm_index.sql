@@ -0,0 +1,14 @@
+-- Trigram index so substring ILIKE '%...%' searches on content can use an
+-- index scan instead of a sequential scan of claude_memory.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Only build (and re-ANALYZE) when missing, so restarts stay cheap
+DO $$
+BEGIN
+    IF to_regclass('claude_memory_content_trgm') IS NULL THEN
+        CREATE INDEX claude_memory_content_trgm
+            ON claude_memory USING gin (content gin_trgm_ops);
+        ANALYZE claude_memory;
+    END IF;
+END
+$$;
@@ -0,0 +1,32 @@
+-- Stored full-text vector for word/phrase searches (search mode "fts").
+-- Requires PostgreSQL 12+ for generated columns.
+-- Checked in the catalog first: ALTER TABLE ... ADD COLUMN IF NOT EXISTS
+-- would take an ACCESS EXCLUSIVE lock on every startup just to find the
+-- column already there.
+DO $$
+DECLARE
+    changed boolean := false;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = 'claude_memory'::regclass
+          AND attname = 'content_tsv'
+          AND NOT attisdropped
+    ) THEN
+        ALTER TABLE claude_memory
+            ADD COLUMN content_tsv tsvector
+            GENERATED ALWAYS AS (to_tsvector('english', content)) STORED;
+        changed := true;
+    END IF;
+
+    IF to_regclass('claude_memory_tsv_idx') IS NULL THEN
+        CREATE INDEX claude_memory_tsv_idx
+            ON claude_memory USING gin (content_tsv);
+        changed := true;
+    END IF;
+
+    IF changed THEN
+        ANALYZE claude_memory;
+    END IF;
+END
+$$;
@@ -0,0 +1,14 @@
+-- B-tree for prefix searches ("project%"). Indexes a lowercased, bounded
+-- prefix of content so the match stays case-insensitive like ILIKE and long
+-- memories don't exceed the B-tree row size limit. Must match
+-- PREFIX_INDEX_CHARS in nexus_memory_server.py.
+-- Only build (and re-ANALYZE) when missing, so restarts stay cheap.
+DO $$
+BEGIN
+    IF to_regclass('claude_memory_content_pattern') IS NULL THEN
+        CREATE INDEX claude_memory_content_pattern
+            ON claude_memory (lower(left(content, 512)) text_pattern_ops);
+        ANALYZE claude_memory;
+    END IF;
+END
+$$;
@@ -0,0 +1,25 @@
+-- Let list_memories walk an index in output order and stop at LIMIT
+-- instead of sorting, with and without a topic filter. id breaks ties
+-- between rows sharing a timestamp for keyset pagination.
+-- Only build (and re-ANALYZE) when missing, so restarts stay cheap.
+DO $$
+DECLARE
+    changed boolean := false;
+BEGIN
+    IF to_regclass('claude_memory_topic_ts') IS NULL THEN
+        CREATE INDEX claude_memory_topic_ts
+            ON claude_memory (topic, timestamp DESC, id DESC);
+        changed := true;
+    END IF;
+
+    IF to_regclass('claude_memory_ts') IS NULL THEN
+        CREATE INDEX claude_memory_ts
+            ON claude_memory (timestamp DESC, id DESC);
+        changed := true;
+    END IF;
+
+    IF changed THEN
+        ANALYZE claude_memory;
+    END IF;
+END
+$$;
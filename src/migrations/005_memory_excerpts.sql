@@ -0,0 +1,44 @@
+-- Narrow copy of claude_memory for "excerpt" searches, so substring matches
+-- on the leading part of each memory don't dereference TOASTed content.
+-- EXCERPT_CHARS in nexus_memory_server.py must match LEFT(content, 1024).
+-- Only build (and ANALYZE) what is missing, so restarts stay cheap.
+DO $$
+DECLARE
+    changed boolean := false;
+BEGIN
+    -- An earlier definition carried an unused content_length column whose
+    -- length() forced every refresh to read full content; rebuild without it
+    IF EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = to_regclass('claude_memory_short')
+          AND attname = 'content_length'
+          AND NOT attisdropped
+    ) THEN
+        DROP MATERIALIZED VIEW claude_memory_short;
+    END IF;
+
+    IF to_regclass('claude_memory_short') IS NULL THEN
+        CREATE MATERIALIZED VIEW claude_memory_short AS
+            SELECT id, LEFT(content, 1024) AS excerpt, topic, timestamp
+            FROM claude_memory;
+        changed := true;
+    END IF;
+
+    -- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    IF to_regclass('claude_memory_short_id') IS NULL THEN
+        CREATE UNIQUE INDEX claude_memory_short_id
+            ON claude_memory_short (id);
+        changed := true;
+    END IF;
+
+    IF to_regclass('claude_memory_short_excerpt_trgm') IS NULL THEN
+        CREATE INDEX claude_memory_short_excerpt_trgm
+            ON claude_memory_short USING gin (excerpt gin_trgm_ops);
+        changed := true;
+    END IF;
+
+    IF changed THEN
+        ANALYZE claude_memory_short;
+    END IF;
+END
+$$;
@@ -12,15 +12,40 @@ Environment Variables:
   PG_USER: PostgreSQL user (default: postgres)
   PG_PASSWORD: PostgreSQL password (required)
   PG_DATABASE: Database name (default: CLAUDE)
+  PG_POOL_MIN: Minimum pooled connections per worker (default: 5, capped at PG_POOL_MAX)
+  PG_POOL_MAX: Maximum pooled connections per worker (default: 20 // WORKERS,
+               at least 2); the server can open up to WORKERS x PG_POOL_MAX
+  PG_STATEMENT_CACHE_SIZE: Prepared statements cached per connection,
+                           0 disables e.g. behind PgBouncer (default: 100)
+  CACHE_TTL: Seconds to cache read responses, 0 disables (default: 0).
+             The cache is per process and a write only clears the process
+             that handled it, so only enable it with a single process. It is
+             ignored when WORKERS > 1, and must stay 0 when an external
+             launcher runs several processes (uvicorn --workers, gunicorn
+             with UvicornWorker), which this module cannot detect.
+  EXCERPT_REFRESH_INTERVAL: Seconds between refreshes of the excerpt search
+                            view after writes (default: 60)
   PORT: Server port (default: 8001)
+  WORKERS: Uvicorn worker processes (default: 1)
+  UVICORN_LOOP: Event loop, e.g. uvloop (default: auto, uvloop if installed)
+  UVICORN_HTTP: HTTP parser, e.g. httptools (default: auto, httptools if installed)
 """
 
 import os
-from fastapi import FastAPI, HTTPException
+import asyncio
+import csv
+import io
+import json
+import time
+import functools
+import inspect
+import contextlib
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Optional, List
+import asyncpg
+from typing import Optional, List, Any, Dict, Tuple
 from datetime import datetime
 
 # Configuration from environment variables
@@ -32,20 +57,84 @@ DB_CONFIG = {
     "password": os.environ.get("PG_PASSWORD", "postgres")
 }
 
+WORKERS = int(os.environ.get("WORKERS", "1"))
+UVICORN_LOOP = os.environ.get("UVICORN_LOOP", "auto")
+UVICORN_HTTP = os.environ.get("UVICORN_HTTP", "auto")
+
+# Pool sizes are per worker; by default the total stays around 20 connections
+# however many workers run, well under Postgres's max_connections=100
+POOL_MAX = int(os.environ.get("PG_POOL_MAX", str(max(2, 20 // WORKERS))))
+POOL_MIN = min(int(os.environ.get("PG_POOL_MIN", "5")), POOL_MAX)
+
+# asyncpg prepares each distinct query once per connection and reuses the
+# server-side statement, skipping parse/plan on repeat calls
+STATEMENT_CACHE_SIZE = int(os.environ.get("PG_STATEMENT_CACHE_SIZE", "100"))
+
 PORT = int(os.environ.get("PORT", "8001"))
 
+# Each process would hold its own cache and a write would only invalidate one
+# of them, so caching is opt-in and only safe with a single process
+CACHE_TTL = int(os.environ.get("CACHE_TTL", "0")) if WORKERS == 1 else 0
+CACHE_MAX_ENTRIES = 1024
+CACHE_PREFIX = "claude_memory:"
+
+# Rows per INSERT statement for bulk creates
+BULK_PAGE_SIZE = 1000
+
+# Indexes that /memories/copy can drop and rebuild around a large import
+HEAVY_INDEXES = ["claude_memory_content_trgm", "claude_memory_tsv_idx", "claude_memory_content_pattern"]
+
+# Characters of content returned per /search result
+SEARCH_PREVIEW_CHARS = 500
+
+# Search result columns; content is truncated in SQL so long memories
+# aren't shipped over the wire in full just to be cut down
+SEARCH_COLUMNS = f"""
+    id,
+    LEFT(content, {SEARCH_PREVIEW_CHARS}) AS content,
+    length(content) > {SEARCH_PREVIEW_CHARS} AS truncated,
+    timestamp, topic, importance
+"""
+
+# Length of content indexed by the claude_memory_short excerpt view
+EXCERPT_CHARS = 1024
+
+EXCERPT_REFRESH_INTERVAL = int(os.environ.get("EXCERPT_REFRESH_INTERVAL", "60"))
+
+# Advisory lock key so only one worker refreshes the excerpt view at a time
+EXCERPT_REFRESH_LOCK_ID = 7300102
+
+# Length of the content prefix covered by the claude_memory_content_pattern index
+PREFIX_INDEX_CHARS = 512
+
+# SQL migrations applied in filename order on startup
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# Advisory lock key so concurrent workers don't apply migrations at the same time
+MIGRATION_LOCK_ID = 7300101
+
+# A migration that can't get its table lock in time fails (and is retried on
+# the next start) instead of stalling every query queued behind it
+MIGRATION_LOCK_TIMEOUT = "5s"
+
 app = FastAPI(
     title="NEXUS Memory Server",
     description="Search, store, and manage memories from persistent memory database. Provides unlimited context CRUD operations.",
     version="2.0.0",
-    servers=[{"url": f"http://localhost:{PORT}"}]
+    servers=[{"url": f"http://localhost:{PORT}"}],
+    default_response_class=ORJSONResponse
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+app.state.pool = None
+app.state.excerpts_stale = False
+app.state.excerpt_refresher = None
 
 # ==================== Request/Response Models ====================
 
 class MemorySearchRequest(BaseModel):
     query: str
     limit: Optional[int] = 10
+    mode: Optional[str] = "ilike"
 
 class MemoryCreateRequest(BaseModel):
     content: str
@@ -53,6 +142,9 @@ class MemoryCreateRequest(BaseModel):
     importance: Optional[int] = 5
     source: Optional[str] = "openwebui"
 
+class MemoryBulkCreateRequest(BaseModel):
+    items: List[MemoryCreateRequest]
+
 class MemoryUpdateRequest(BaseModel):
     content: Optional[str] = None
     topic: Optional[str] = None
@@ -67,68 +159,291 @@ class MemoryResponse(BaseModel):
 
 # ==================== Database Helper ====================
 
-def get_db_connection():
-    """Get database connection with error handling"""
+async def db():
+    """
+    FastAPI dependency yielding a pooled connection for the request.
+
+    Connections are in autocommit mode: a single-statement write such as
+    create_memory is committed in the same round trip that runs it, so no
+    commit() follows. Endpoints with several statements (bulk, copy) group
+    them in conn.transaction().
+    """
+    async with acquire_db() as conn:
+        yield conn
+
+@contextlib.asynccontextmanager
+async def acquire_db():
+    """Check a connection out of the pool, surfacing failures as HTTP 500"""
     try:
-        return psycopg2.connect(**DB_CONFIG, cursor_factory=RealDictCursor)
+        conn = await app.state.pool.acquire()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database connection failed: {str(e)}")
+    try:
+        yield conn
+    finally:
+        await app.state.pool.release(conn)
+
+async def run_migrations(conn):
+    """Apply every idempotent SQL migration in MIGRATIONS_DIR"""
+    if not os.path.isdir(MIGRATIONS_DIR):
+        return
+
+    await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_ID)
+    await conn.execute(f"SET lock_timeout = '{MIGRATION_LOCK_TIMEOUT}'")
+    try:
+        for name in sorted(os.listdir(MIGRATIONS_DIR)):
+            if not name.endswith(".sql"):
+                continue
+            with open(os.path.join(MIGRATIONS_DIR, name)) as f:
+                sql = f.read()
+            try:
+                await conn.execute(sql)
+            except Exception as e:
+                print(f"Migration {name} failed: {e}")
+    finally:
+        await conn.execute("RESET lock_timeout")
+        await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_ID)
+
+def csv_row_to_memory(row: Dict[str, Any]) -> MemoryCreateRequest:
+    """Build a MemoryCreateRequest from an uploaded CSV row"""
+    # An empty importance cell means "not given", so the model default applies;
+    # empty text cells stay empty strings, as they would in a JSON body
+    fields = {k: v for k, v in row.items() if k is not None}
+    if fields.get("importance") == "":
+        del fields["importance"]
+    return MemoryCreateRequest(**fields)
+
+def is_prefix_query(query: str) -> bool:
+    """Whether a search query is a trailing-wildcard prefix the B-tree index can serve"""
+    # Only a single trailing wildcard: with an inner "%" the rest of the
+    # pattern could match beyond the indexed prefix
+    return (
+        query.endswith("%")
+        and "%" not in query[:-1]
+        and len(query) <= PREFIX_INDEX_CHARS
+    )
+
+# ==================== Response Cache ====================
+
+# In-process cache of read responses: key -> (expires_at, response).
+# Off unless CACHE_TTL is set, and only safe with a single process.
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+
+# Bumped on every invalidation; a read only stores its response if no write
+# finished while it was running, so stale results can't outlive a write
+_cache_generation = 0
+
+def cached(ttl_seconds: int = CACHE_TTL):
+    """
+    Cache an endpoint's successful responses keyed on its arguments.
+
+    The wrapped endpoint declares conn: Any = Depends(db) as usual, but the
+    decorator hides that parameter from FastAPI and only checks a
+    connection out of the pool on a cache miss.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            if ttl_seconds <= 0:
+                async with acquire_db() as conn:
+                    return await func(conn=conn, **kwargs)
+
+            key = f"{CACHE_PREFIX}{func.__name__}:{sorted(kwargs.items())!r}"
+            now = time.monotonic()
+
+            entry = _response_cache.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+            generation = _cache_generation
+            async with acquire_db() as conn:
+                response = await func(conn=conn, **kwargs)
+
+            if generation == _cache_generation and not (isinstance(response, dict) and "error" in response):
+                if len(_response_cache) >= CACHE_MAX_ENTRIES:
+                    _response_cache.pop(next(iter(_response_cache)))
+                _response_cache[key] = (now + ttl_seconds, response)
+            return response
+
+        wrapper.__signature__ = signature.replace(
+            parameters=[p for name, p in signature.parameters.items() if name != "conn"]
+        )
+        return wrapper
+    return decorator
+
+def invalidate_cache(prefix: str = CACHE_PREFIX):
+    """Drop every cached response whose key starts with prefix"""
+    global _cache_generation
+    _cache_generation += 1
+    for key in [k for k in _response_cache if k.startswith(prefix)]:
+        del _response_cache[key]
+
+def invalidates_cache(func):
+    """Clear cached reads after the wrapped write endpoint succeeds"""
+    @functools.wraps(func)
+    async def wrapper(**kwargs):
+        response = await func(**kwargs)
+        invalidate_cache()
+        app.state.excerpts_stale = True
+        return response
+    return wrapper
+
+# ==================== Excerpt View ====================
+
+async def refresh_excerpts():
+    """Refresh claude_memory_short unless another worker is already doing it"""
+    async with app.state.pool.acquire() as conn:
+        if not await conn.fetchval("SELECT pg_try_advisory_lock($1)", EXCERPT_REFRESH_LOCK_ID):
+            return
+        try:
+            await conn.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY claude_memory_short")
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", EXCERPT_REFRESH_LOCK_ID)
+
+async def refresh_excerpts_periodically():
+    """Background task refreshing the excerpt view after writes"""
+    while True:
+        await asyncio.sleep(EXCERPT_REFRESH_INTERVAL)
+        if not app.state.excerpts_stale:
+            continue
+        app.state.excerpts_stale = False
+        try:
+            await refresh_excerpts()
+        except Exception as e:
+            app.state.excerpts_stale = True
+            print(f"Excerpt view refresh failed: {e}")
+
+# ==================== Lifecycle ====================
+
+@app.on_event("startup")
+async def startup():
+    """Open the connection pool and apply migrations"""
+    app.state.pool = await asyncpg.create_pool(
+        min_size=POOL_MIN,
+        max_size=POOL_MAX,
+        statement_cache_size=STATEMENT_CACHE_SIZE,
+        **DB_CONFIG
+    )
+    async with app.state.pool.acquire() as conn:
+        await run_migrations(conn)
+    app.state.excerpt_refresher = asyncio.create_task(refresh_excerpts_periodically())
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop background work and close the connection pool"""
+    if app.state.excerpt_refresher is not None:
+        app.state.excerpt_refresher.cancel()
+        app.state.excerpt_refresher = None
+    if app.state.pool is not None:
+        await app.state.pool.close()
+        app.state.pool = None
 
 # ==================== Endpoints ====================
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint with API info"""
     return {
         "name": "NEXUS Memory Server",
         "version": "2.0.0",
         "description": "Persistent memory CRUD operations",
-        "endpoints": ["/search", "/memories", "/stats", "/health"]
+        "endpoints": ["/search", "/memories", "/memories/bulk", "/memories/copy", "/stats", "/health"]
     }
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.close()
-        conn.close()
+        async with app.state.pool.acquire() as conn:
+            await conn.fetchval("SELECT 1")
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
 @app.post("/search", operation_id="search_memories")
-def search_memories(request: MemorySearchRequest):
+@cached()
+async def search_memories(request: MemorySearchRequest, conn: Any = Depends(db)):
     """
     Search memories by content using text matching.
 
     Use this to find relevant memories based on keywords or phrases.
+    Set mode to "fts" to match whole words with full-text search, or leave
+    it as "ilike" to match any substring. In "ilike" mode a query ending in
+    "%" (e.g. "project%") matches memories that start with it instead.
+    Set mode to "excerpt" for a faster substring search that only looks at
+    the first 1024 characters of each memory; text changed by an update is
+    only searchable there after the next excerpt refresh.
     Returns memories sorted by most recent first.
     """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    if request.mode not in ("ilike", "fts", "excerpt"):
+        raise HTTPException(status_code=400, detail=f"Unknown search mode: {request.mode}")
 
-        cursor.execute("""
-            SELECT id, content, timestamp, topic, importance
-            FROM claude_memory
-            WHERE content ILIKE %s
-            ORDER BY timestamp DESC
-            LIMIT %s
-        """, (f'%{request.query}%', request.limit))
-
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+    try:
+        if request.mode == "fts":
+            results = await conn.fetch(f"""
+                SELECT {SEARCH_COLUMNS}
+                FROM claude_memory
+                WHERE content_tsv @@ plainto_tsquery('english', $1)
+                ORDER BY timestamp DESC
+                LIMIT $2
+            """, request.query, request.limit)
+        elif request.mode == "excerpt":
+            # Substring match against the narrow excerpt view, joined back to
+            # claude_memory by id for ordering. Rows added since the last
+            # refresh are matched directly. View hits are rechecked against the
+            # current content before the LIMIT, so memories updated since the
+            # refresh never return overwritten text or take a slot for a stale
+            # match; left() only reads the start of TOASTed content.
+            results = await conn.fetch(f"""
+                WITH hits AS (
+                    SELECT id FROM (
+                        SELECT s.id, m.timestamp
+                        FROM claude_memory_short s
+                        JOIN claude_memory m USING (id)
+                        WHERE s.excerpt ILIKE $1
+                          AND LEFT(m.content, {EXCERPT_CHARS}) ILIKE $1
+                        UNION ALL
+                        SELECT id, timestamp
+                        FROM claude_memory
+                        WHERE id > (SELECT COALESCE(MAX(id), 0) FROM claude_memory_short)
+                          AND LEFT(content, {EXCERPT_CHARS}) ILIKE $1
+                    ) candidates
+                    ORDER BY timestamp DESC
+                    LIMIT $2
+                )
+                SELECT {SEARCH_COLUMNS}
+                FROM hits
+                JOIN claude_memory USING (id)
+                ORDER BY timestamp DESC
+            """, f'%{request.query}%', request.limit)
+        elif is_prefix_query(request.query):
+            # Prefix match, served by the text_pattern_ops B-tree
+            results = await conn.fetch(f"""
+                SELECT {SEARCH_COLUMNS}
+                FROM claude_memory
+                WHERE lower(left(content, {PREFIX_INDEX_CHARS})) LIKE lower($1)
+                  AND content ILIKE $1
+                ORDER BY timestamp DESC
+                LIMIT $2
+            """, request.query, request.limit)
+        else:
+            # Substring match, served by the trigram GIN index
+            results = await conn.fetch(f"""
+                SELECT {SEARCH_COLUMNS}
+                FROM claude_memory
+                WHERE content ILIKE $1
+                ORDER BY timestamp DESC
+                LIMIT $2
+            """, f'%{request.query}%', request.limit)
 
         formatted_results = []
         for row in results:
             formatted_results.append({
                 "id": row["id"],
-                "content": row["content"][:500] + "..." if len(row["content"]) > 500 else row["content"],
-                "timestamp": str(row["timestamp"]),
+                "content": row["content"] + "..." if row["truncated"] else row["content"],
+                "timestamp": row["timestamp"],
                 "topic": row["topic"],
                 "importance": row["importance"]
             })
@@ -136,7 +451,8 @@ def search_memories(request: MemorySearchRequest):
         return {
             "results": formatted_results,
             "count": len(formatted_results),
-            "query": request.query
+            "query": request.query,
+            "mode": request.mode
         }
 
     except HTTPException:
@@ -145,41 +461,71 @@ def search_memories(request: MemorySearchRequest):
         return {"results": [], "count": 0, "error": str(e)}
 
 @app.get("/memories", operation_id="list_memories")
-def list_memories(limit: int = 20, offset: int = 0, topic: Optional[str] = None):
+@cached()
+async def list_memories(
+    limit: int = 20,
+    offset: int = 0,
+    topic: Optional[str] = None,
+    before_ts: Optional[str] = None,
+    before_id: Optional[int] = None,
+    conn: Any = Depends(db)
+):
     """
     List recent memories with optional topic filter.
 
     Use this to browse stored memories or filter by topic.
+    To fetch the next page, pass the previous response's next_cursor as
+    before_ts and next_cursor_id as before_id. Paging with offset still
+    works but is deprecated, since deep offsets get slower.
     """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        if topic:
-            cursor.execute("""
-                SELECT id, content, timestamp, topic, importance
-                FROM claude_memory
-                WHERE topic = %s
-                ORDER BY timestamp DESC
-                LIMIT %s OFFSET %s
-            """, (topic, limit, offset))
+    conditions = []
+    values = []
+
+    if topic:
+        values.append(topic)
+        conditions.append(f"topic = ${len(values)}")
+
+    if before_ts:
+        try:
+            cursor_ts = datetime.fromisoformat(before_ts.replace("Z", "+00:00")).isoformat()
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid before_ts: {before_ts}")
+
+        values.append(cursor_ts)
+        ts_param = f"${len(values)}::text::timestamptz"
+        if before_id is not None:
+            # Break ties between memories created in the same transaction
+            values.append(before_id)
+            conditions.append(
+                f"timestamp <= {ts_param} AND (timestamp < {ts_param} OR id < ${len(values)})"
+            )
         else:
-            cursor.execute("""
-                SELECT id, content, timestamp, topic, importance
-                FROM claude_memory
-                ORDER BY timestamp DESC
-                LIMIT %s OFFSET %s
-            """, (limit, offset))
+            conditions.append(f"timestamp < {ts_param}")
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+    values.append(limit)
+    limit_param = f"${len(values)}"
+    values.append(offset)
+    offset_param = f"${len(values)}"
 
+    try:
+        results = await conn.fetch(f"""
+            SELECT id, content, timestamp, topic, importance
+            FROM claude_memory
+            {where}
+            ORDER BY timestamp DESC, id DESC
+            LIMIT {limit_param} OFFSET {offset_param}
+        """, *values)
+
+        memories = [dict(row) for row in results]
         return {
-            "memories": [dict(row) for row in results],
-            "count": len(results),
+            "memories": memories,
+            "count": len(memories),
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": memories[-1]["timestamp"].isoformat() if memories else None,
+            "next_cursor_id": memories[-1]["id"] if memories else None
         }
 
     except HTTPException:
@@ -188,25 +534,19 @@ def list_memories(limit: int = 20, offset: int = 0, topic: Optional[str] = None)
         return {"memories": [], "count": 0, "error": str(e)}
 
 @app.get("/memories/{memory_id}", operation_id="get_memory")
-def get_memory(memory_id: int):
+@cached()
+async def get_memory(memory_id: int, conn: Any = Depends(db)):
     """
     Get a specific memory by ID.
 
     Returns the full content of a single memory.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        result = await conn.fetchrow("""
             SELECT id, content, timestamp, topic, importance
             FROM claude_memory
-            WHERE id = %s
-        """, (memory_id,))
-
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+            WHERE id = $1
+        """, memory_id)
 
         if not result:
             raise HTTPException(status_code=404, detail=f"Memory {memory_id} not found")
@@ -219,26 +559,19 @@ def get_memory(memory_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/memories", operation_id="create_memory")
-def create_memory(request: MemoryCreateRequest):
+@invalidates_cache
+async def create_memory(request: MemoryCreateRequest, conn: Any = Depends(db)):
     """
     Store a new memory in the database.
 
     Use this to save important information for future reference.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        result = await conn.fetchrow("""
             INSERT INTO claude_memory (content, topic, importance, source, timestamp)
-            VALUES (%s, %s, %s, %s, NOW())
+            VALUES ($1, $2, $3, $4, NOW())
             RETURNING id, content, timestamp, topic, importance
-        """, (request.content, request.topic, request.importance, request.source))
-
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        conn.close()
+        """, request.content, request.topic, request.importance, request.source)
 
         return {
             "success": True,
@@ -251,47 +584,151 @@ def create_memory(request: MemoryCreateRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/memories/bulk", operation_id="create_memories_bulk")
+@invalidates_cache
+async def create_memories_bulk(request: MemoryBulkCreateRequest, conn: Any = Depends(db)):
+    """
+    Store many new memories in a single transaction.
+
+    Use this instead of repeated create_memory calls when saving a batch.
+    """
+    try:
+        ids = []
+        async with conn.transaction():
+            for start in range(0, len(request.items), BULK_PAGE_SIZE):
+                page = request.items[start:start + BULK_PAGE_SIZE]
+                rows = await conn.fetch("""
+                    INSERT INTO claude_memory (content, topic, importance, source, timestamp)
+                    SELECT content, topic, importance, source, NOW()
+                    FROM unnest($1::text[], $2::text[], $3::int[], $4::text[])
+                        AS t(content, topic, importance, source)
+                    RETURNING id
+                """,
+                    [i.content for i in page],
+                    [i.topic for i in page],
+                    [i.importance for i in page],
+                    [i.source for i in page])
+                ids.extend(row["id"] for row in rows)
+
+        return {
+            "success": True,
+            "message": f"{len(ids)} memories created successfully",
+            "ids": ids,
+            "count": len(ids)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/memories/copy", operation_id="copy_memories")
+@invalidates_cache
+async def copy_memories(request: Request, rebuild_indexes: bool = False):
+    """
+    Import a large batch of memories with COPY.
+
+    Accepts either a JSON body shaped like /memories/bulk or a multipart CSV
+    upload in a "file" field with a header row of content, topic, importance
+    and source columns. Set rebuild_indexes to drop the search indexes before
+    the import and recreate them afterwards, which is faster for one-shot
+    imports but locks the table for the duration.
+    """
+    try:
+        if request.headers.get("content-type", "").startswith("multipart/form-data"):
+            form = await request.form()
+            upload = form.get("file")
+            if upload is None or isinstance(upload, str):
+                raise HTTPException(status_code=400, detail="Missing CSV file upload")
+            text = (await upload.read()).decode("utf-8-sig")
+            items = [csv_row_to_memory(row) for row in csv.DictReader(io.StringIO(text))]
+        else:
+            items = MemoryBulkCreateRequest(**await request.json()).items
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid import payload: {str(e)}")
+
+    # Only check a connection out once the upload has been received and parsed
+    try:
+        async with acquire_db() as conn, conn.transaction():
+            # Take NOW() once, as the timestamp column's own type, so every row
+            # gets the value the single-row insert would have produced in this
+            # transaction and binary COPY can encode it
+            ts_type = await conn.fetchval("""
+                SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+                WHERE attrelid = 'claude_memory'::regclass AND attname = 'timestamp'
+            """)
+            now = await conn.fetchval(f"SELECT NOW()::{ts_type}")
+
+            records = [
+                (item.content, item.topic, item.importance, item.source, now)
+                for item in items
+            ]
+
+            index_defs = []
+            if rebuild_indexes:
+                index_defs = await conn.fetch("""
+                    SELECT indexname, indexdef FROM pg_indexes
+                    WHERE tablename = 'claude_memory' AND indexname = ANY($1::text[])
+                """, HEAVY_INDEXES)
+                for index in index_defs:
+                    await conn.execute(f'DROP INDEX "{index["indexname"]}"')
+
+            await conn.copy_records_to_table(
+                "claude_memory",
+                records=records,
+                columns=["content", "topic", "importance", "source", "timestamp"]
+            )
+
+            for index in index_defs:
+                await conn.execute(index["indexdef"])
+
+        return {
+            "success": True,
+            "message": f"{len(items)} memories imported successfully",
+            "count": len(items)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.put("/memories/{memory_id}", operation_id="update_memory")
-def update_memory(memory_id: int, request: MemoryUpdateRequest):
+@invalidates_cache
+async def update_memory(memory_id: int, request: MemoryUpdateRequest, conn: Any = Depends(db)):
     """
     Update an existing memory.
 
     Use this to modify the content, topic, or importance of a stored memory.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
         # Build dynamic update query
         updates = []
         values = []
 
         if request.content is not None:
-            updates.append("content = %s")
             values.append(request.content)
+            updates.append(f"content = ${len(values)}")
         if request.topic is not None:
-            updates.append("topic = %s")
             values.append(request.topic)
+            updates.append(f"topic = ${len(values)}")
         if request.importance is not None:
-            updates.append("importance = %s")
             values.append(request.importance)
+            updates.append(f"importance = ${len(values)}")
 
         if not updates:
             raise HTTPException(status_code=400, detail="No fields to update")
 
         values.append(memory_id)
 
-        cursor.execute(f"""
+        result = await conn.fetchrow(f"""
             UPDATE claude_memory
             SET {', '.join(updates)}
-            WHERE id = %s
+            WHERE id = ${len(values)}
             RETURNING id, content, timestamp, topic, importance
-        """, values)
-
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        conn.close()
+        """, *values)
 
         if not result:
             raise HTTPException(status_code=404, detail=f"Memory {memory_id} not found")
@@ -308,26 +745,19 @@ def update_memory(memory_id: int, request: MemoryUpdateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/memories/{memory_id}", operation_id="delete_memory")
-def delete_memory(memory_id: int):
+@invalidates_cache
+async def delete_memory(memory_id: int, conn: Any = Depends(db)):
     """
     Delete a memory by ID.
 
     Use this to remove outdated or incorrect memories.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        result = await conn.fetchrow("""
             DELETE FROM claude_memory
-            WHERE id = %s
+            WHERE id = $1
             RETURNING id
-        """, (memory_id,))
-
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        conn.close()
+        """, memory_id)
 
         if not result:
             raise HTTPException(status_code=404, detail=f"Memory {memory_id} not found")
@@ -343,44 +773,49 @@ def delete_memory(memory_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/stats", operation_id="get_memory_stats")
-def get_memory_stats():
+@cached()
+async def get_memory_stats(approximate: bool = False, conn: Any = Depends(db)):
     """
     Get memory database statistics.
 
     Returns total count, recent count, and topics breakdown.
+    Set approximate to read the total from the planner's row estimate
+    instead of counting every row.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Total count
-        cursor.execute("SELECT COUNT(*) as count FROM claude_memory")
-        total_count = cursor.fetchone()["count"]
-
-        # Recent count (last 7 days)
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM claude_memory
-            WHERE timestamp > NOW() - INTERVAL '7 days'
-        """)
-        recent_count = cursor.fetchone()["count"]
+        if approximate:
+            total_sql = """
+                SELECT CASE WHEN reltuples < 0
+                    THEN (SELECT COUNT(*) FROM claude_memory)
+                    ELSE reltuples::bigint END
+                FROM pg_class WHERE oid = 'claude_memory'::regclass
+            """
+        else:
+            total_sql = "SELECT COUNT(*) FROM claude_memory"
 
-        # Topics breakdown
-        cursor.execute("""
-            SELECT topic, COUNT(*) as count
-            FROM claude_memory
-            GROUP BY topic
-            ORDER BY count DESC
-            LIMIT 10
+        # Total count, recent count (last 7 days) and topics breakdown in one round trip
+        row = await conn.fetchrow(f"""
+            WITH t AS (
+                SELECT topic, COUNT(*) AS count
+                FROM claude_memory
+                GROUP BY topic
+                ORDER BY count DESC
+                LIMIT 10
+            )
+            SELECT
+                ({total_sql}) AS total,
+                (SELECT COUNT(*) FROM claude_memory
+                 WHERE timestamp > NOW() - INTERVAL '7 days') AS recent,
+                (SELECT json_agg(t ORDER BY t.count DESC) FROM t) AS topics
         """)
-        topics = cursor.fetchall()
-
-        cursor.close()
-        conn.close()
+        total_count = row["total"]
+        recent_count = row["recent"]
+        topics = json.loads(row["topics"]) if row["topics"] else []
 
         return {
             "total_memories": total_count,
             "recent_memories_7d": recent_count,
-            "topics": [dict(t) for t in topics],
+            "topics": topics,
             "database": DB_CONFIG["database"],
             "status": "connected"
         }
@@ -397,7 +832,7 @@ def get_memory_stats():
         }
 
 @app.get("/openapi.json")
-def get_openapi():
+async def get_openapi():
     """Return OpenAPI spec for External Tool registration"""
     return app.openapi()
 
@@ -405,6 +840,17 @@ def get_openapi():
 
 if __name__ == "__main__":
     import uvicorn
-    print(f"Starting NEXUS Memory Server on port {PORT}")
+    print(f"Starting NEXUS Memory Server on port {PORT} with {WORKERS} worker(s)")
     print(f"Database: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
+    print(f"Connection pool: up to {POOL_MAX} per worker, {POOL_MAX * WORKERS} total")
+    if WORKERS > 1 and int(os.environ.get("CACHE_TTL", "0")) > 0:
+        print("CACHE_TTL ignored: the response cache is per process and can't be invalidated across workers")
+    # Each worker opens its own pool in the startup event
+    uvicorn.run(
+        "nexus_memory_server:app",
+        host="0.0.0.0",
+        port=PORT,
+        workers=WORKERS,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP
+    )
@@ -6,7 +6,7 @@ version: 2.3.0
 license: MIT
 description: Connect AI agents to NocoDB databases with per-agent access control
 required_open_webui_version: 0.3.9
-requirements: requests
+requirements: httpx[http2], cachetools
 
 This is an OpenWebUI Python Tool that provides direct NocoDB API access.
 Configure via Admin Panel -> Tools -> NocoDB Database Connector -> Valves
@@ -18,10 +18,43 @@ Valves Configuration:
                       Format: {"model-id": "base-id", "another-model": "another-base"}
 """
 
-import requests
+import httpx
 import json
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field
+from cachetools import TTLCache
+
+# Table metadata cache shared by every Tools instance, keyed by
+# "<kind>:<base_id>:<name>". Entries expire so renamed tables are picked up.
+_TABLE_CACHE = TTLCache(maxsize=1024, ttl=300)
+_LOCK = threading.Lock()
+
+# HTTP/2 clients shared by every Tools instance, keyed by NOCODB_API_URL, so
+# requests to NocoDB are multiplexed over reused connections. OpenWebUI gives
+# tools no shutdown hook, so they live for the process and their connections
+# are closed when it exits.
+_CLIENTS: Dict[str, httpx.AsyncClient] = {}
+
+
+def _build_client(base_url: str) -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for the NocoDB API"""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=30,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=100),
+        ),
+    )
+
+
+@lru_cache(maxsize=32)
+def _parse_mapping(mapping: str) -> Dict[str, str]:
+    """Parse AGENT_BASE_MAPPING once per distinct valve value"""
+    return json.loads(mapping)
 
 
 class Tools:
@@ -43,7 +76,7 @@ class Tools:
 
     def __init__(self):
         self.valves = self.Valves()
-        self._table_cache = {}
+        self._table_cache = _TABLE_CACHE
 
     def _get_base_id_for_agent(self, __model__: Optional[Dict] = None) -> Optional[str]:
         """Get the base_id that this agent is allowed to access"""
@@ -56,45 +89,71 @@ class Tools:
             else:
                 model_id = str(__model__)
 
-            mapping = json.loads(self.valves.AGENT_BASE_MAPPING)
+            mapping = _parse_mapping(self.valves.AGENT_BASE_MAPPING)
             return mapping.get(model_id)
         except Exception as e:
             print(f"Error getting base_id for agent: {e}")
             return None
 
-    def _get_table_id(self, base_id: str, table_name: str) -> Optional[str]:
-        """Get table_id from table name by querying the base metadata"""
-        cache_key = f"{base_id}_{table_name}"
-
-        if cache_key in self._table_cache:
-            return self._table_cache[cache_key]
-
-        url = f"{self.valves.NOCODB_API_URL}/api/v2/meta/bases/{base_id}/tables"
-        headers = {
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared client for the configured API URL"""
+        base_url = self.valves.NOCODB_API_URL
+        client = _CLIENTS.get(base_url)
+        if client is None or client.is_closed:
+            client = _CLIENTS[base_url] = _build_client(base_url)
+        return client
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Authentication headers for the current valves"""
+        return {
             "xc-token": self.valves.NOCODB_API_TOKEN,
             "Content-Type": "application/json",
         }
 
+    async def _warm_cache(self, base_id: str) -> bool:
+        """Cache the IDs and titles of every table in a base with one metadata fetch"""
+        endpoint = f"/api/v2/meta/bases/{base_id}/tables"
+
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            client = self._get_client()
+            response = await client.get(endpoint, headers=self._get_headers())
             response.raise_for_status()
             data = response.json()
-
-            for table in data.get("list", []):
-                if (
-                    table.get("table_name") == table_name
-                    or table.get("title") == table_name
-                ):
-                    table_id = table.get("id")
-                    self._table_cache[cache_key] = table_id
-                    return table_id
-
-            return None
         except Exception as e:
-            print(f"Error getting table_id: {e}")
+            print(f"Error loading tables for base {base_id}: {e}")
+            return False
+
+        table_ids = {}
+        titles = []
+        for table in data.get("list", []):
+            # First match wins, as when names were resolved one at a time
+            for name in (table.get("table_name"), table.get("title")):
+                if name is not None:
+                    table_ids.setdefault(name, table.get("id"))
+            titles.append(table.get("title"))
+
+        with _LOCK:
+            for name, table_id in table_ids.items():
+                self._table_cache[f"table_id:{base_id}:{name}"] = table_id
+            self._table_cache[f"table_list:{base_id}:"] = titles
+        return True
+
+    async def _get_table_id(self, base_id: str, table_name: str) -> Optional[str]:
+        """Get table_id from table name, loading the base metadata on a cache miss"""
+        cache_key = f"table_id:{base_id}:{table_name}"
+
+        with _LOCK:
+            table_id = self._table_cache.get(cache_key)
+        if table_id is not None:
+            return table_id
+
+        if not await self._warm_cache(base_id):
             return None
 
-    def _make_request(
+        with _LOCK:
+            return self._table_cache.get(cache_key)
+
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
@@ -102,27 +161,22 @@ class Tools:
         params: Optional[Dict] = None,
     ) -> Dict[str, Any]:
         """Make authenticated request to NocoDB API"""
-        url = f"{self.valves.NOCODB_API_URL}{endpoint}"
-        headers = {
-            "xc-token": self.valves.NOCODB_API_TOKEN,
-            "Content-Type": "application/json",
-        }
-
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
+            client = self._get_client()
+            response = await client.request(
+                method,
+                endpoint,
+                headers=self._get_headers(),
                 json=data,
                 params=params,
-                timeout=30,
             )
             response.raise_for_status()
             return {"success": True, "data": response.json()}
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError covers non-JSON bodies, e.g. a proxy error page
             return {"success": False, "error": str(e)}
 
-    def query_table(
+    async def query_table(
         self,
         table_name: str,
         filters: Optional[str] = None,
@@ -152,11 +206,11 @@ class Tools:
                 }
             )
 
-        table_id = self._get_table_id(base_id, table_name)
+        table_id = await self._get_table_id(base_id, table_name)
 
         if not table_id:
             # List available tables to help user
-            tables = self._list_available_tables(base_id)
+            tables = await self._list_available_tables(base_id)
             return json.dumps(
                 {
                     "success": False,
@@ -180,21 +234,26 @@ class Tools:
         if sort:
             params["sort"] = sort
 
-        result = self._make_request("GET", endpoint, params=params)
+        result = await self._make_request("GET", endpoint, params=params)
         return json.dumps(result, indent=2)
 
-    def _list_available_tables(self, base_id: str) -> list:
+    async def _list_available_tables(self, base_id: str) -> list:
         """Helper to list available tables in a base"""
-        try:
-            endpoint = f"/api/v2/meta/bases/{base_id}/tables"
-            result = self._make_request("GET", endpoint)
-            if result.get("success"):
-                return [t.get("title") for t in result.get("data", {}).get("list", [])]
-            return []
-        except:
+        cache_key = f"table_list:{base_id}:"
+
+        with _LOCK:
+            tables = self._table_cache.get(cache_key)
+        if tables is not None:
+            return list(tables)
+
+        if not await self._warm_cache(base_id):
             return []
 
-    def get_record(
+        with _LOCK:
+            tables = self._table_cache.get(cache_key)
+        return list(tables) if tables is not None else []
+
+    async def get_record(
         self, table_name: str, record_id: str, __model__: Optional[Dict] = None
     ) -> str:
         """
@@ -211,7 +270,7 @@ class Tools:
                 {"success": False, "error": "No database configured for this agent"}
             )
 
-        table_id = self._get_table_id(base_id, table_name)
+        table_id = await self._get_table_id(base_id, table_name)
 
         if not table_id:
             return json.dumps(
@@ -219,10 +278,10 @@ class Tools:
             )
 
         endpoint = f"/api/v2/tables/{table_id}/records/{record_id}"
-        result = self._make_request("GET", endpoint)
+        result = await self._make_request("GET", endpoint)
         return json.dumps(result, indent=2)
 
-    def create_record(
+    async def create_record(
         self, table_name: str, data: str, __model__: Optional[Dict] = None
     ) -> str:
         """
@@ -239,7 +298,7 @@ class Tools:
                 {"success": False, "error": "No database configured for this agent"}
             )
 
-        table_id = self._get_table_id(base_id, table_name)
+        table_id = await self._get_table_id(base_id, table_name)
 
         if not table_id:
             return json.dumps(
@@ -252,10 +311,10 @@ class Tools:
             return json.dumps({"success": False, "error": "Invalid JSON data format"})
 
         endpoint = f"/api/v2/tables/{table_id}/records"
-        result = self._make_request("POST", endpoint, data=record_data)
+        result = await self._make_request("POST", endpoint, data=record_data)
         return json.dumps(result, indent=2)
 
-    def update_record(
+    async def update_record(
         self,
         table_name: str,
         record_id: str,
@@ -277,7 +336,7 @@ class Tools:
                 {"success": False, "error": "No database configured for this agent"}
             )
 
-        table_id = self._get_table_id(base_id, table_name)
+        table_id = await self._get_table_id(base_id, table_name)
 
         if not table_id:
             return json.dumps(
@@ -290,10 +349,10 @@ class Tools:
             return json.dumps({"success": False, "error": "Invalid JSON data format"})
 
         endpoint = f"/api/v2/tables/{table_id}/records/{record_id}"
-        result = self._make_request("PATCH", endpoint, data=record_data)
+        result = await self._make_request("PATCH", endpoint, data=record_data)
         return json.dumps(result, indent=2)
 
-    def delete_record(
+    async def delete_record(
         self, table_name: str, record_id: str, __model__: Optional[Dict] = None
     ) -> str:
         """
@@ -310,7 +369,7 @@ class Tools:
                 {"success": False, "error": "No database configured for this agent"}
             )
 
-        table_id = self._get_table_id(base_id, table_name)
+        table_id = await self._get_table_id(base_id, table_name)
 
         if not table_id:
             return json.dumps(
@@ -318,10 +377,10 @@ class Tools:
             )
 
         endpoint = f"/api/v2/tables/{table_id}/records/{record_id}"
-        result = self._make_request("DELETE", endpoint)
+        result = await self._make_request("DELETE", endpoint)
         return json.dumps(result, indent=2)
 
-    def list_tables(self, __model__: Optional[Dict] = None) -> str:
+    async def list_tables(self, __model__: Optional[Dict] = None) -> str:
         """
         List all tables in the database.
 
@@ -335,10 +394,10 @@ class Tools:
             )
 
         endpoint = f"/api/v2/meta/bases/{base_id}/tables"
-        result = self._make_request("GET", endpoint)
+        result = await self._make_request("GET", endpoint)
         return json.dumps(result, indent=2)
 
-    def get_table_schema(
+    async def get_table_schema(
         self, table_name: str, __model__: Optional[Dict] = None
     ) -> str:
         """
@@ -354,7 +413,7 @@ class Tools:
                 {"success": False, "error": "No database configured for this agent"}
             )
 
-        table_id = self._get_table_id(base_id, table_name)
+        table_id = await self._get_table_id(base_id, table_name)
 
         if not table_id:
             return json.dumps(
@@ -362,5 +421,5 @@ class Tools:
             )
 
         endpoint = f"/api/v2/meta/tables/{table_id}"
-        result = self._make_request("GET", endpoint)
+        result = await self._make_request("GET", endpoint)
         return json.dumps(result, indent=2)